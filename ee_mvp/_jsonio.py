@@ -0,0 +1,23 @@
+"""JSON parsing that uses :mod:`orjson` when it is installed."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import json
+
+try:  # pragma: no cover - exercised only when the optional dependency is present
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text; decode errors are :class:`json.JSONDecodeError` either way."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals that the stdlib accepts.
+            pass
+    return json.loads(data)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from functools import lru_cache
 from math import pi, sqrt
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Mapping, Sequence, Tuple
 
 import csv
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 class TableLookupError(ValueError):
     """Raised when a lookup against the embedded placeholder tables fails."""
@@ -16,44 +21,57 @@ class TableLookupError(ValueError):
 
 _TABLE_DIR = Path(__file__).with_suffix("").parent / "tables"
 
+# The helpers below are pure functions of a handful of distinct conductor/raceway
+# parameters, so per-edge calls are memoized.
+_LOOKUP_CACHE_SIZE = 4096
+
+_SQRT3 = sqrt(3.0)
 
-def _load_table(filename: str) -> Iterable[Dict[str, str]]:
+
+def _load_table(filename: str, *columns: str) -> Iterator[Tuple[str, ...]]:
+    """Yield the requested ``columns`` of ``filename`` as stripped string tuples."""
     path = _TABLE_DIR / filename
-    with open(path, "r", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
+    with open(path, "r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = [name.strip() for name in next(reader)]
+        indices = [header.index(column) for column in columns]
         for row in reader:
-            yield row
+            yield tuple(row[idx].strip() for idx in indices)
 
 
 @lru_cache(maxsize=1)
-def _ampacity_table() -> Dict[Tuple[str, str, int], Dict[str, float]]:
+def _ampacity_table() -> Mapping[Tuple[str, str, int], Mapping[str, float]]:
     table: Dict[Tuple[str, str, int], Dict[str, float]] = {}
-    for row in _load_table("nec_310_16_stub.csv"):
-        key = (row["material"].strip().upper(), row["insulation"].strip().upper(), int(row["temp_C"]))
-        size_map = table.setdefault(key, {})
-        size_map[row["size_awg"].strip()] = float(row["ampacity_A"])
-    return table
+    rows = _load_table("nec_310_16_stub.csv", "material", "insulation", "temp_C", "size_awg", "ampacity_A")
+    for material, insulation, temp_C, size_awg, ampacity in rows:
+        table.setdefault((material.upper(), insulation.upper(), int(temp_C)), {})[size_awg] = float(ampacity)
+    return MappingProxyType({key: MappingProxyType(sizes) for key, sizes in table.items()})
 
 
 @lru_cache(maxsize=None)
-def _conductor_od_table() -> Dict[str, float]:
-    return {row["size_awg"].strip(): float(row["od_in"]) for row in _load_table("conductor_od_stub.csv")}
+def _conductor_od_table() -> Mapping[str, float]:
+    rows = _load_table("conductor_od_stub.csv", "size_awg", "od_in")
+    return MappingProxyType({size: float(od) for size, od in rows})
 
 
 @lru_cache(maxsize=None)
-def _emt_area_table() -> Dict[float, float]:
-    return {float(row["trade_size_in"]): float(row["area_sq_in"]) for row in _load_table("emt_area_stub.csv")}
+def _emt_area_table() -> Mapping[float, float]:
+    rows = _load_table("emt_area_stub.csv", "trade_size_in", "area_sq_in")
+    return MappingProxyType({float(trade_size): float(area) for trade_size, area in rows})
+
+
+@lru_cache(maxsize=None)
+def _emt_areas_sorted() -> Tuple[Tuple[float, float], ...]:
+    """Return ``(trade_size_in, area_sq_in)`` pairs ordered by trade size."""
+    return tuple(sorted(_emt_area_table().items()))
 
 
 @lru_cache(maxsize=1)
-def _egc_table() -> Tuple[list[tuple[int, str]], list[tuple[int, str]]]:
-    cu: list[tuple[int, str]] = []
-    al: list[tuple[int, str]] = []
-    for row in _load_table("egc_table_stub.csv"):
-        limit = int(row["ocpd_max_A"])
-        cu.append((limit, row["cu_size_awg"].strip()))
-        al.append((limit, row["al_size_awg"].strip()))
-    return cu, al
+def _egc_table() -> Tuple[Tuple[int, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Return ``(ocpd_limits, cu_sizes, al_sizes)`` sorted by OCPD limit for bisection."""
+    rows = _load_table("egc_table_stub.csv", "ocpd_max_A", "cu_size_awg", "al_size_awg")
+    limits, cu, al = zip(*sorted((int(limit), cu, al) for limit, cu, al in rows))
+    return limits, cu, al
 
 
 _OHMS_PER_KFT_R = {
@@ -86,13 +104,48 @@ _OHMS_PER_KFT_R = {
     },
 }
 
+# Flattened (material, size) view of the table above so lookups are a single hash.
+_OHMS_PER_KFT_R_FLAT = {
+    (material, size): ohms for material, sizes in _OHMS_PER_KFT_R.items() for size, ohms in sizes.items()
+}
+
 _INSTALLATION_X_PER_KFT = {
     "EMT": 0.085,
     "PVC": 0.065,
     "RMC": 0.09,
 }
 
-
+_AWG_ORDER = (
+    "#14",
+    "#12",
+    "#10",
+    "#8",
+    "#6",
+    "#4",
+    "#3",
+    "#2",
+    "#1",
+    "1/0",
+    "2/0",
+    "3/0",
+    "4/0",
+    "250",
+    "300",
+    "350",
+    "400",
+    "500",
+    "600",
+)
+_AWG_ORDER_INDEX = {size: idx for idx, size in enumerate(_AWG_ORDER)}
+
+# Ambient correction curve: upper ambient bound (deg C) and factor per insulation column.
+_AMBIENT_LIMITS_C = (30.0, 35.0, 40.0, 45.0)
+_AMBIENT_FACTORS_60C = (1.0, 0.88, 0.82, 0.71)
+_AMBIENT_FACTORS_75C = (1.0, 0.94, 0.88, 0.82)
+_AMBIENT_FACTORS_90C = (1.0, 0.96, 0.91, 0.87)
+
+
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def _normalize_material(material: str) -> str:
     mat = material.strip().upper()
     if mat.startswith("CU"):
@@ -102,6 +155,7 @@ def _normalize_material(material: str) -> str:
     raise TableLookupError(f"Unknown conductor material '{material}'.")
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def _normalize_insulation(insulation: str) -> str:
     text = insulation.strip().upper().replace(" ", "")
     aliases = {
@@ -113,12 +167,16 @@ def _normalize_insulation(insulation: str) -> str:
     return aliases.get(text, text)
 
 
+_TEMPERATURE_COLUMNS = (60, 75, 90)
+
+
 def _temperature_column(temp_C: int | None) -> int:
     if temp_C is None:
         return 75
-    return 90 if temp_C >= 90 else (75 if temp_C >= 75 else 60)
+    return _TEMPERATURE_COLUMNS[(temp_C >= 75) + (temp_C >= 90)]
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def ampacity_base(size_awg: str, material: str, insulation: str, temp_C: int | None = None) -> float:
     """Return the base ampacity from the stubbed 310.16 table."""
     key = (_normalize_material(material), _normalize_insulation(insulation), _temperature_column(temp_C))
@@ -136,25 +194,25 @@ def ampacity_base(size_awg: str, material: str, insulation: str, temp_C: int | N
     return table[size_awg]
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def ambient_correction_factor(temp_C: int, ambient_C: float | None, rooftop_height_in: float | None) -> float:
     """Return an ambient correction factor using a simplified curve."""
+    if rooftop_height_in is None and (ambient_C is None or ambient_C <= 30.0):
+        return 1.0
     ambient = 30.0 if ambient_C is None else float(ambient_C)
     if rooftop_height_in is not None and rooftop_height_in <= 12:
         ambient += 17.0
     if temp_C <= 60:
-        ref = [(30, 1.0), (35, 0.88), (40, 0.82), (45, 0.71)]
+        factors = _AMBIENT_FACTORS_60C
     elif temp_C <= 75:
-        ref = [(30, 1.0), (35, 0.94), (40, 0.88), (45, 0.82)]
+        factors = _AMBIENT_FACTORS_75C
     else:
-        ref = [(30, 1.0), (35, 0.96), (40, 0.91), (45, 0.87)]
-    factor = ref[-1][1]
-    for limit, value in ref:
-        if ambient <= limit:
-            factor = value
-            break
-    return factor
+        factors = _AMBIENT_FACTORS_90C
+    idx = bisect_left(_AMBIENT_LIMITS_C, ambient)
+    return factors[idx] if idx < len(factors) else factors[-1]
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def conductor_correction_factor(ccc: int) -> float:
     if ccc <= 3:
         return 1.0
@@ -166,11 +224,10 @@ def conductor_correction_factor(ccc: int) -> float:
 
 
 def terminal_temperature_limit(temp_C: int | None) -> int:
-    if temp_C is None:
-        return 75
     return _temperature_column(temp_C)
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def ampacity_adjusted(
     size_awg: str,
     material: str,
@@ -190,14 +247,35 @@ def ampacity_adjusted(
     return adjusted * max(1, int(parallel_sets))
 
 
+def ampacity_adjusted_array(
+    sizes: Sequence[str],
+    material: str,
+    insulation: str,
+    temp_C: int,
+    ambient_C: float | None,
+    rooftop_height_in: float | None,
+    ccc: int,
+    term_temp_C: int | None,
+    parallel_sets: int = 1,
+) -> np.ndarray:
+    """Vectorized :func:`ampacity_adjusted` over a sweep of conductor ``sizes``."""
+    terminal_temp = terminal_temperature_limit(term_temp_C)
+    base = np.array([ampacity_base(size, material, insulation, temp_C) for size in sizes], dtype=np.float64)
+    terminal = np.array([ampacity_base(size, material, insulation, terminal_temp) for size in sizes], dtype=np.float64)
+    derating = ambient_correction_factor(temp_C, ambient_C, rooftop_height_in) * conductor_correction_factor(ccc)
+    return np.minimum(base * derating, terminal) * max(1, int(parallel_sets))
+
+
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def resistance_per_kft(material: str, size_awg: str) -> float:
     mat = _normalize_material(material)
     try:
-        return _OHMS_PER_KFT_R[mat][size_awg]
+        return _OHMS_PER_KFT_R_FLAT[(mat, size_awg)]
     except KeyError as exc:  # pragma: no cover - friendly message exercised indirectly
         raise TableLookupError(f"No resistance data for {mat} conductor size {size_awg}.") from exc
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def reactance_per_kft(installation: str) -> float:
     inst = installation.strip().upper()
     try:
@@ -206,6 +284,7 @@ def reactance_per_kft(installation: str) -> float:
         raise TableLookupError(f"No reactance data for installation '{installation}'.") from exc
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def conductor_area_sq_in(size_awg: str) -> float:
     try:
         od = _conductor_od_table()[size_awg]
@@ -226,58 +305,56 @@ def minimum_raceway_size(conductors: Iterable[tuple[str, int]], fill_fraction: f
     required_area = 0.0
     for size_awg, qty in conductors:
         required_area += conductor_area_sq_in(size_awg) * qty
-    for trade_size, area in sorted(_emt_area_table().items()):
+    sizes = _emt_areas_sorted()
+    for trade_size, area in sizes:
         if required_area <= area * fill_fraction:
             return trade_size
-    return max(_emt_area_table())
+    return sizes[-1][0]
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def equipment_ground_size(ocpd_rating_A: float, material: str = "Cu") -> str:
-    cu_table, al_table = _egc_table()
-    table = cu_table if _normalize_material(material) == "CU" else al_table
-    rating = float(ocpd_rating_A)
-    for limit, awg in table:
-        if rating <= limit:
-            return awg
-    return table[-1][1]
+    limits, cu_sizes, al_sizes = _egc_table()
+    sizes = cu_sizes if _normalize_material(material) == "CU" else al_sizes
+    idx = bisect_left(limits, float(ocpd_rating_A))
+    return sizes[idx] if idx < len(sizes) else sizes[-1]
 
 
 def upsized_equipment_ground(ocpd_rating_A: float, conductor_upsizing_factor: float, material: str = "Cu") -> str:
     base = equipment_ground_size(ocpd_rating_A, material=material)
     if conductor_upsizing_factor <= 1.05:
         return base
-    order = [
-        "#14",
-        "#12",
-        "#10",
-        "#8",
-        "#6",
-        "#4",
-        "#3",
-        "#2",
-        "#1",
-        "1/0",
-        "2/0",
-        "3/0",
-        "4/0",
-        "250",
-        "300",
-        "350",
-        "400",
-        "500",
-        "600",
-    ]
-    try:
-        idx = order.index(base)
-    except ValueError:  # pragma: no cover - base table limited to order
+    idx = _AWG_ORDER_INDEX.get(base)
+    if idx is None:  # pragma: no cover - base table limited to order
         return base
     bump = 1 if conductor_upsizing_factor < 1.35 else 2
-    return order[min(idx + bump, len(order) - 1)]
+    return _AWG_ORDER[min(idx + bump, len(_AWG_ORDER) - 1)]
+
+
+@lru_cache(maxsize=128)
+def _sinphi(pf: float) -> float:
+    return sqrt(max(0.0, 1.0 - pf * pf))
 
 
 def percent_voltage_drop(current_A: float, voltage_ll_V: float, resistance_ohm: float, reactance_ohm: float, pf: float) -> float:
     if voltage_ll_V <= 0:
         return 0.0
     pf = max(0.0, min(1.0, pf))
-    sinphi = sqrt(max(0.0, 1.0 - pf * pf))
-    return (sqrt(3.0) * current_A * (resistance_ohm * pf + reactance_ohm * sinphi) / voltage_ll_V) * 100.0
+    return (_SQRT3 * current_A * (resistance_ohm * pf + reactance_ohm * _sinphi(pf)) / voltage_ll_V) * 100.0
+
+
+def percent_voltage_drop_batch(
+    current_A: ArrayLike,
+    voltage_ll_V: ArrayLike,
+    resistance_ohm: ArrayLike,
+    reactance_ohm: ArrayLike,
+    pf: ArrayLike,
+) -> np.ndarray:
+    """Vectorized :func:`percent_voltage_drop` over broadcastable arrays."""
+    current = np.asarray(current_A, dtype=np.float64)
+    voltage = np.asarray(voltage_ll_V, dtype=np.float64)
+    pf_arr = np.clip(np.asarray(pf, dtype=np.float64), 0.0, 1.0)
+    sinphi = np.sqrt(np.clip(1.0 - pf_arr * pf_arr, 0.0, None))
+    valid = voltage > 0
+    drop = _SQRT3 * current * (np.asarray(resistance_ohm) * pf_arr + np.asarray(reactance_ohm) * sinphi)
+    return np.where(valid, drop / np.where(valid, voltage, 1.0) * 100.0, 0.0)
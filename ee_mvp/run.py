@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, timezone
 from math import sqrt
 from numbers import Real
@@ -10,15 +11,23 @@ from typing import Dict, List, Tuple
 
 import json
 
+import numpy as np
 import pandas as pd
-from pandas.api.types import is_bool_dtype
+from pandas.api.types import is_float_dtype, is_object_dtype
 
+from . import _jsonio
 from .models import PanelSchedule, Project, load_project, load_project_file
 from .version import EE_MVP_VERSION
-from .nec import ampacity_adjusted, minimum_raceway_size, upsized_equipment_ground
+from .nec import (
+    ampacity_adjusted,
+    minimum_raceway_size,
+    reactance_per_kft,
+    resistance_per_kft,
+    upsized_equipment_ground,
+)
 from .scc import available_fault
 from .taps import check_feeder_taps
-from .vd import voltage_drop_percent
+from .vd import voltage_drop_percent_batch
 
 SQRT3 = sqrt(3.0)
 
@@ -37,14 +46,21 @@ def load_config(config: Dict[str, float] | None = None) -> Dict[str, float]:
     return merged
 
 
+def _looks_like_json(text: str) -> bool:
+    """Return whether the first non-whitespace character opens a JSON object or array."""
+    for char in text:
+        if not char.isspace():
+            return char in "{["
+    return False
+
+
 def _ensure_project(project: Project | Dict | str | Path) -> Project:
     if isinstance(project, Project):
         return project
     if isinstance(project, str):
-        stripped = project.strip()
-        if stripped.startswith("{") or stripped.startswith("["):
+        if _looks_like_json(project):
             try:
-                data = json.loads(project)
+                data = _jsonio.loads(project)
             except json.JSONDecodeError:
                 pass
             else:
@@ -66,22 +82,27 @@ class _Calculator:
         for edge in project.edges:
             self.parents.setdefault(edge.to_id, []).append(edge.from_id)
             self.children.setdefault(edge.from_id, []).append(edge.to_id)
+        self.voltages: Dict[str, float] = {node.id: self._node_voltage(node) for node in project.nodes}
         self.schedule: Dict[str, PanelSchedule] = {sched.panel_id: sched for sched in project.panel_schedules}
         self.currents: Dict[str, float] = {}
+        self._order_cache: List[str] | None = None
 
     def _topological_order(self) -> List[str]:
+        if self._order_cache is not None:
+            return self._order_cache
         indegree: Dict[str, int] = {node.id: 0 for node in self.project.nodes}
         for to_id, parents in self.parents.items():
             indegree[to_id] = indegree.get(to_id, 0) + len(parents)
-        queue = [node_id for node_id, deg in indegree.items() if deg == 0]
+        queue = deque(node_id for node_id, deg in indegree.items() if deg == 0)
         order: List[str] = []
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             order.append(node_id)
             for child in self.children.get(node_id, []):
                 indegree[child] -= 1
                 if indegree[child] == 0:
                     queue.append(child)
+        self._order_cache = order
         return order
 
     @staticmethod
@@ -100,44 +121,57 @@ class _Calculator:
         return node.voltage_ll_V or node.sec_V or node.pri_V or 0.0
 
     def panel_summary(self) -> pd.DataFrame:
-        roll_map: Dict[str, float] = {node.id: 0.0 for node in self.project.nodes}
-        rows: List[Dict[str, object]] = []
-        for node in self.project.nodes:
-            schedule = self.schedule.get(node.id, PanelSchedule(panel_id=node.id, entries=[]))
-            cont, noncont = self._schedule_totals(schedule)
-            design = cont * 1.25 + noncont
-            roll_map[node.id] = design
-            rows.append(
-                {
-                    "bus": node.id,
-                    "type": node.type,
-                    "V_ll": self._node_voltage(node),
-                    "rating_A": node.rating_A,
-                    "kVA_cont": cont,
-                    "kVA_noncont": noncont,
-                    "kVA_design": design,
-                }
-            )
+        nodes = self.project.nodes
+        count = len(nodes)
+        buses = [node.id for node in nodes]
+        schedule_totals = [
+            self._schedule_totals(self.schedule[node.id]) if node.id in self.schedule else (0.0, 0.0) for node in nodes
+        ]
+        cont = np.fromiter((totals[0] for totals in schedule_totals), dtype=np.float64, count=count)
+        noncont = np.fromiter((totals[1] for totals in schedule_totals), dtype=np.float64, count=count)
+        design = cont * 1.25 + noncont
+        roll_map: Dict[str, float] = dict(zip(buses, design.tolist()))
         for node_id in reversed(self._topological_order()):
             load = roll_map.get(node_id, 0.0)
             for parent in self.parents.get(node_id, []):
                 roll_map[parent] = roll_map.get(parent, 0.0) + load
-        summary_rows: List[Dict[str, object]] = []
-        for row in rows:
-            total = roll_map[row["bus"]]
-            voltage = row["V_ll"] or 0.0
-            current = total * 1000.0 / (SQRT3 * voltage) if voltage else 0.0
-            self.currents[row["bus"]] = current
-            rating = row["rating_A"] or 0.0
-            utilization = (current / rating * 100.0) if rating else 0.0
-            summary_rows.append({**row, "kVA_total": total, "I_design_A": current, "utilization_pct": utilization})
-        return pd.DataFrame(summary_rows)
+        totals = np.fromiter((roll_map[bus] for bus in buses), dtype=np.float64, count=count)
+        voltages = np.fromiter((self.voltages[bus] for bus in buses), dtype=np.float64, count=count)
+        ratings = np.fromiter((node.rating_A or 0.0 for node in nodes), dtype=np.float64, count=count)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            currents = np.where(voltages != 0, totals * 1000.0 / (SQRT3 * voltages), 0.0)
+            utilization = np.where(ratings != 0, currents / ratings * 100.0, 0.0)
+        self.currents.update(zip(buses, currents.tolist()))
+        return pd.DataFrame(
+            {
+                "bus": pd.Series(buses, dtype=str),
+                "type": pd.Series([node.type for node in nodes], dtype=str),
+                "V_ll": voltages,
+                "rating_A": [node.rating_A for node in nodes],
+                "kVA_cont": cont,
+                "kVA_noncont": noncont,
+                "kVA_design": design,
+                "kVA_total": totals,
+                "I_design_A": currents,
+                "utilization_pct": utilization,
+            }
+        )
 
     def edge_checks(self) -> pd.DataFrame:
         pf = self.config.get("pf", 0.9)
         branch_limit = self.config.get("vd_branch_pct", 3.0)
         feeder_limit = self.config.get("vd_feeder_pct", 3.0)
-        rows: List[Dict[str, object]] = []
+        from_ids: List[str] = []
+        to_ids: List[str] = []
+        sizes: List[str] = []
+        qtys: List[int] = []
+        lengths: List[float] = []
+        ampacities: List[float] = []
+        loads: List[float] = []
+        egcs: List[str] = []
+        conduits: List[float] = []
+        vd_inputs: List[Tuple[float, float, float, float, float, int]] = []
+        vd_limits: List[float] = []
         for edge in self.project.edges:
             cable = edge.cable
             if not cable or not cable.size_awg:
@@ -156,24 +190,21 @@ class _Calculator:
                 cable.qty_per_phase,
             )
             length = cable.length_ft or 0.0
-            voltage = 0.0
-            to_node = next((n for n in self.project.nodes if n.id == edge.to_id), None)
-            if to_node:
-                voltage = self._node_voltage(to_node)
-            vd_pct = 0.0
+            voltage = self.voltages.get(edge.to_id, 0.0)
             if length and voltage:
-                vd_pct = voltage_drop_percent(
-                    load_current,
-                    voltage,
-                    cable.conductor,
-                    cable.size_awg,
-                    length,
-                    cable.installation,
-                    cable.qty_per_phase,
-                    pf,
+                vd_inputs.append(
+                    (
+                        load_current,
+                        voltage,
+                        resistance_per_kft(cable.conductor, cable.size_awg),
+                        reactance_per_kft(cable.installation),
+                        length,
+                        cable.qty_per_phase,
+                    )
                 )
-            limit = branch_limit if cable.is_branch else feeder_limit
-            ampacity_margin = ampacity - load_current
+            else:
+                vd_inputs.append((load_current, 0.0, 0.0, 0.0, 0.0, 1))
+            vd_limits.append(branch_limit if cable.is_branch else feeder_limit)
             ocpd_rating = edge.ocpd.rating_A if edge.ocpd else load_current * 1.25
             base_ampacity = ampacity_adjusted(
                 cable.size_awg,
@@ -189,70 +220,94 @@ class _Calculator:
             upsizing_factor = base_ampacity / ampacity if ampacity else 1.0
             egc = upsized_equipment_ground(ocpd_rating, upsizing_factor, material=cable.conductor)
             conduit = minimum_raceway_size([(cable.size_awg, cable.qty_per_phase * 3), (egc, cable.qty_per_phase)])
-            rows.append(
-                {
-                    "from": edge.from_id,
-                    "to": edge.to_id,
-                    "size_awg": cable.size_awg,
-                    "qty_per_phase": cable.qty_per_phase,
-                    "length_ft": length,
-                    "ampacity_A": ampacity,
-                    "load_A": load_current,
-                    "ampacity_margin_A": ampacity_margin,
-                    "vd_pct": vd_pct,
-                    "vd_ok": vd_pct <= limit,
-                    "egc_awg": egc,
-                    "min_conduit_in": conduit,
-                }
-            )
-        return pd.DataFrame(rows)
+            from_ids.append(edge.from_id)
+            to_ids.append(edge.to_id)
+            sizes.append(cable.size_awg)
+            qtys.append(cable.qty_per_phase)
+            lengths.append(length)
+            ampacities.append(ampacity)
+            loads.append(load_current)
+            egcs.append(egc)
+            conduits.append(conduit)
+        vd_pcts: List[float] = voltage_drop_percent_batch(*zip(*vd_inputs), pf=pf).tolist() if vd_inputs else []
+        return pd.DataFrame(
+            {
+                "from": pd.Series(from_ids, dtype=str),
+                "to": pd.Series(to_ids, dtype=str),
+                "size_awg": pd.Series(sizes, dtype=str),
+                "qty_per_phase": pd.Series(qtys, dtype="int64"),
+                "length_ft": lengths,
+                "ampacity_A": ampacities,
+                "load_A": loads,
+                "ampacity_margin_A": [ampacity - load for ampacity, load in zip(ampacities, loads)],
+                "vd_pct": vd_pcts,
+                "vd_ok": pd.Series([vd_pct <= limit for vd_pct, limit in zip(vd_pcts, vd_limits)], dtype=bool),
+                "egc_awg": pd.Series(egcs, dtype=str),
+                "min_conduit_in": conduits,
+            }
+        )
 
     def total_voltage_drop(self, edge_df: pd.DataFrame) -> pd.DataFrame:
         totals: Dict[str, float] = {node.id: 0.0 for node in self.project.nodes}
         vd_map: Dict[Tuple[str, str], float] = {}
-        for _, row in edge_df.iterrows():
-            vd_map[(row["from"], row["to"])] = row["vd_pct"]
-        order = self._topological_order()
-        for node_id in order:
-            for child in self.children.get(node_id, []):
-                totals[child] = totals[node_id] + vd_map.get((node_id, child), 0.0)
-        records: List[Dict[str, object]] = []
+        if not edge_df.empty:
+            vd_map = dict(zip(zip(edge_df["from"], edge_df["to"]), edge_df["vd_pct"]))
+        if any(vd_map.values()):
+            # Without any non-zero segment drop every path total stays at 0.0.
+            for node_id in self._topological_order():
+                for child in self.children.get(node_id, []):
+                    totals[child] = totals[node_id] + vd_map.get((node_id, child), 0.0)
         limit = self.config.get("vd_total_pct", 5.0)
+        buses: List[str] = []
+        total_vds: List[float] = []
         for node in self.project.nodes:
-            voltage = self._node_voltage(node)
-            if not voltage:
+            if not self.voltages[node.id]:
                 continue
-            total_vd = totals.get(node.id, 0.0)
-            records.append({"bus": node.id, "total_vd_pct": total_vd, "vd_total_ok": total_vd <= limit})
-        return pd.DataFrame(records)
+            buses.append(node.id)
+            total_vds.append(totals.get(node.id, 0.0))
+        return pd.DataFrame(
+            {
+                "bus": pd.Series(buses, dtype=str),
+                "total_vd_pct": total_vds,
+                "vd_total_ok": pd.Series([total_vd <= limit for total_vd in total_vds], dtype=bool),
+            }
+        )
 
 
 class _AnalysisDataFrame(pd.DataFrame):
-    """``DataFrame`` subclass that preserves a ``_rows`` attribute."""
+    """``DataFrame`` subclass exposing a lazily built ``_rows`` record list."""
 
-    _metadata = ["_rows"]
+    _rows_cache: List[Dict[str, object]] | None = None
 
     @property
     def _constructor(self):  # pragma: no cover - inherited behavior exercised indirectly
         return _AnalysisDataFrame
 
+    @property
+    def _rows(self) -> List[Dict[str, object]]:
+        if self._rows_cache is None:
+            self._rows_cache = self.to_dict("records")
+        return self._rows_cache
+
 
 def _attach_rows_attr(df: pd.DataFrame) -> pd.DataFrame:
-    """Attach a ``_rows`` attribute with the frame's record representation."""
+    """Wrap ``df`` so it exposes the frame's record representation as ``_rows``."""
 
-    frame = _AnalysisDataFrame(df) if not isinstance(df, _AnalysisDataFrame) else df
-    frame._rows = frame.to_dict("records")
-    return frame
+    return _AnalysisDataFrame(df) if not isinstance(df, _AnalysisDataFrame) else df
 
 
 def _rounded(df: pd.DataFrame, digits: int = 3) -> pd.DataFrame:
     if df.empty:
-        return _attach_rows_attr(df.copy())
+        # Only empty frames skip the copy; every populated result has float columns.
+        return _attach_rows_attr(df)
+    float_columns = [column for column in df.columns if is_float_dtype(df[column])]
+    object_columns = [column for column in df.columns if is_object_dtype(df[column])]
     rounded = df.copy()
-    for column in rounded.columns:
+    for column in float_columns:
+        # Python's round is correctly rounded; DataFrame.round can differ on .5 ties.
+        rounded[column] = [round(value, digits) for value in rounded[column].tolist()]
+    for column in object_columns:
         series = rounded[column]
-        if is_bool_dtype(series):
-            continue
         mask = series.apply(lambda value: isinstance(value, Real) and not isinstance(value, bool))
         if mask.any():
             rounded.loc[mask, column] = series[mask].apply(lambda value: round(value, digits))
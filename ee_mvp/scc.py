@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections import deque
 from math import sqrt
-from typing import Dict
+from typing import Dict, List
 
 import pandas as pd
 
@@ -38,7 +38,11 @@ def _initial_impedance(project: Project) -> Dict[str, complex]:
 
 
 def available_fault(project: Project) -> pd.DataFrame:
-    """Return a dataframe with the approximate available fault at each bus."""
+    """Return a dataframe with the approximate available fault at each bus.
+
+    The topology is not assumed to be radial: each edge is walked once, so loops
+    terminate and a bus fed by several parents keeps the last path reached.
+    """
     z_map = _initial_impedance(project)
     children: Dict[str, list[Edge]] = {}
     for edge in project.edges:
@@ -57,7 +61,9 @@ def available_fault(project: Project) -> pd.DataFrame:
             seen.add(key)
             z_map[edge.to_id] = parent_z + _edge_impedance(edge)
             queue.append(edge.to_id)
-    rows = []
+    buses: List[str] = []
+    faults: List[float] = []
+    impedances: List[float] = []
     for node in project.nodes:
         z = z_map.get(node.id)
         if not z:
@@ -65,6 +71,9 @@ def available_fault(project: Project) -> pd.DataFrame:
         voltage = node.voltage_ll_V or node.sec_V or node.pri_V
         if not voltage:
             continue
-        fault = voltage / (SQRT3 * abs(z)) / 1000.0
-        rows.append({"bus": node.id, "available_fault_kA": fault, "Z_th_ohm": abs(z)})
-    return pd.DataFrame(rows)
+        buses.append(node.id)
+        faults.append(voltage / (SQRT3 * abs(z)) / 1000.0)
+        impedances.append(abs(z))
+    return pd.DataFrame(
+        {"bus": pd.Series(buses, dtype=str), "available_fault_kA": faults, "Z_th_ohm": impedances}
+    )
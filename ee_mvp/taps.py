@@ -15,7 +15,13 @@ def _current_at_bus(currents: Dict[str, float], bus: str) -> float:
 
 
 def check_feeder_taps(project: Project, load_currents: Dict[str, float]) -> pd.DataFrame:
-    rows: List[Dict[str, object]] = []
+    from_ids: List[str] = []
+    to_ids: List[str] = []
+    lengths: List[float] = []
+    ampacities: List[float] = []
+    loads: List[float] = []
+    passes_10ft: List[bool] = []
+    passes_25ft: List[bool] = []
     for edge in project.edges:
         cable = edge.cable
         if not cable or not cable.is_tap:
@@ -38,16 +44,24 @@ def check_feeder_taps(project: Project, load_currents: Dict[str, float]) -> pd.D
         twentyfive_ok = False
         if length <= 25.0 and source_ocpd:
             twentyfive_ok = ampacity >= source_ocpd / 3.0
-        rows.append(
-            {
-                "from": edge.from_id,
-                "to": edge.to_id,
-                "length_ft": length,
-                "ampacity_A": ampacity,
-                "load_A": load,
-                "passes_10ft": ten_ft_ok,
-                "passes_25ft": twentyfive_ok,
-                "passes": ten_ft_ok or twentyfive_ok,
-            }
-        )
-    return pd.DataFrame(rows)
+        from_ids.append(edge.from_id)
+        to_ids.append(edge.to_id)
+        lengths.append(length)
+        ampacities.append(ampacity)
+        loads.append(load)
+        passes_10ft.append(ten_ft_ok)
+        passes_25ft.append(twentyfive_ok)
+    return pd.DataFrame(
+        {
+            "from": pd.Series(from_ids, dtype=str),
+            "to": pd.Series(to_ids, dtype=str),
+            "length_ft": lengths,
+            "ampacity_A": ampacities,
+            "load_A": loads,
+            "passes_10ft": pd.Series(passes_10ft, dtype=bool),
+            "passes_25ft": pd.Series(passes_25ft, dtype=bool),
+            "passes": pd.Series(
+                [ten_ft or twentyfive for ten_ft, twentyfive in zip(passes_10ft, passes_25ft)], dtype=bool
+            ),
+        }
+    )
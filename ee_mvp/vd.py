@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
 
-from .nec import percent_voltage_drop, reactance_per_kft, resistance_per_kft
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .nec import (
+    _LOOKUP_CACHE_SIZE,
+    percent_voltage_drop,
+    percent_voltage_drop_batch,
+    reactance_per_kft,
+    resistance_per_kft,
+)
 
 
 def conductor_impedance(
@@ -22,6 +32,7 @@ def conductor_impedance(
     return r, x
 
 
+@lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
 def voltage_drop_percent(
     current_A: float,
     voltage_ll_V: float,
@@ -34,3 +45,43 @@ def voltage_drop_percent(
 ) -> float:
     r, x = conductor_impedance(material, size_awg, length_ft, installation, qty_per_phase)
     return percent_voltage_drop(current_A, voltage_ll_V, r, x, pf)
+
+
+def voltage_drop_percent_batch(
+    current_A: ArrayLike,
+    voltage_ll_V: ArrayLike,
+    resistance_per_kft_ohm: ArrayLike,
+    reactance_per_kft_ohm: ArrayLike,
+    length_ft: ArrayLike,
+    qty_per_phase: ArrayLike = 1,
+    pf: ArrayLike = 0.9,
+) -> np.ndarray:
+    """Vectorized :func:`voltage_drop_percent` from per-kft impedances already looked up."""
+    qty = np.maximum(1, np.asarray(qty_per_phase, dtype=np.int64))
+    factor = np.asarray(length_ft, dtype=np.float64) / 1000.0
+    r = np.asarray(resistance_per_kft_ohm, dtype=np.float64) * factor / qty
+    x = np.asarray(reactance_per_kft_ohm, dtype=np.float64) * factor / qty
+    return percent_voltage_drop_batch(current_A, voltage_ll_V, r, x, pf)
+
+
+def voltage_drop_percent_array(
+    current_A: ArrayLike,
+    voltage_ll_V: ArrayLike,
+    material: str,
+    sizes: Sequence[str],
+    length_ft: ArrayLike,
+    installation: str,
+    qty_per_phase: ArrayLike = 1,
+    pf: ArrayLike = 0.9,
+) -> np.ndarray:
+    """Vectorized :func:`voltage_drop_percent` over a sweep of conductor ``sizes``."""
+    resistance = [resistance_per_kft(material, size) for size in sizes]
+    return voltage_drop_percent_batch(
+        current_A,
+        voltage_ll_V,
+        resistance,
+        reactance_per_kft(installation),
+        length_ft,
+        qty_per_phase,
+        pf,
+    )
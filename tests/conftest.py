@@ -0,0 +1,15 @@
+import json
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def demo_project_path():
+    return Path(__file__).resolve().parents[1] / "examples" / "demo_project.json"
+
+
+@pytest.fixture
+def demo_project_data(demo_project_path):
+    # Parsed fresh for every test, so callers may edit it in place.
+    return json.loads(demo_project_path.read_text())
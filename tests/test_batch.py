@@ -0,0 +1,58 @@
+import numpy as np
+
+from ee_mvp.nec import (
+    ampacity_adjusted,
+    ampacity_adjusted_array,
+    percent_voltage_drop,
+    percent_voltage_drop_batch,
+    reactance_per_kft,
+    resistance_per_kft,
+)
+from ee_mvp.vd import voltage_drop_percent, voltage_drop_percent_array, voltage_drop_percent_batch
+
+SIZES = ["#3", "#2", "#1", "1/0", "2/0", "3/0", "4/0", "250", "300", "350", "400", "500"]
+
+
+def test_percent_voltage_drop_batch_matches_scalar():
+    currents = [100.0, 250.0, 40.0, 10.0]
+    voltages = [480.0, 208.0, 0.0, 480.0]
+    resistances = [0.02, 0.005, 0.01, 0.1]
+    reactances = [0.004, 0.002, 0.001, 0.0]
+    pfs = [0.9, 1.2, 0.85, -0.1]
+    expected = [
+        percent_voltage_drop(i, v, r, x, pf)
+        for i, v, r, x, pf in zip(currents, voltages, resistances, reactances, pfs)
+    ]
+    actual = percent_voltage_drop_batch(currents, voltages, resistances, reactances, pfs)
+    assert np.allclose(actual, expected)
+
+
+def test_voltage_drop_percent_batch_matches_scalar():
+    sizes = ["#3", "1/0", "4/0", "500"]
+    lengths = [50.0, 120.0, 0.0, 300.0]
+    qtys = [1, 2, 1, 3]
+    expected = [
+        voltage_drop_percent(150.0, 480.0, "Cu", size, length, "EMT", qty, 0.85)
+        for size, length, qty in zip(sizes, lengths, qtys)
+    ]
+    actual = voltage_drop_percent_batch(
+        150.0,
+        480.0,
+        [resistance_per_kft("Cu", size) for size in sizes],
+        reactance_per_kft("EMT"),
+        lengths,
+        qtys,
+        0.85,
+    )
+    assert np.allclose(actual, expected)
+
+
+def test_ampacity_adjusted_array_matches_scalar():
+    args = ("Cu", "THHN", 90, 40.0, 6.0, 6, 75, 2)
+    expected = [ampacity_adjusted(size, *args) for size in SIZES]
+    assert np.allclose(ampacity_adjusted_array(SIZES, *args), expected)
+
+
+def test_voltage_drop_percent_array_matches_scalar():
+    expected = [voltage_drop_percent(100.0, 480.0, "Cu", size, 100.0, "PVC", 1, 0.9) for size in SIZES]
+    assert np.allclose(voltage_drop_percent_array(100.0, 480.0, "Cu", SIZES, 100.0, "PVC", 1, 0.9), expected)
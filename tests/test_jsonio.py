@@ -0,0 +1,44 @@
+import json
+import math
+
+import pytest
+
+from ee_mvp import DEFAULT_CONFIG, _jsonio, analyze
+from ee_mvp.models import load_project_file
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        assert _jsonio.orjson is not None
+    else:
+        monkeypatch.setattr(_jsonio, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def project_text_with_nan(demo_project_data):
+    demo_project_data["assumptions"].append({"note": "unmeasured", "value": float("nan")})
+    return json.dumps(demo_project_data)
+
+
+def test_loads_accepts_nan(json_backend):
+    value = _jsonio.loads('{"x": NaN}')["x"]
+    assert math.isnan(value)
+
+
+def test_loads_raises_json_decode_error(json_backend):
+    with pytest.raises(json.JSONDecodeError):
+        _jsonio.loads("{not json")
+
+
+def test_analyze_accepts_json_string_with_nan(json_backend, project_text_with_nan):
+    results = analyze(project_text_with_nan, DEFAULT_CONFIG)
+    assert all(not frame.empty for frame in results.values())
+
+
+def test_load_project_file_accepts_nan(json_backend, project_text_with_nan, tmp_path):
+    path = tmp_path / "project.json"
+    path.write_text(project_text_with_nan, encoding="utf-8")
+    project = load_project_file(path)
+    assert math.isnan(project.assumptions[-1]["value"])
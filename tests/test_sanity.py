@@ -1,11 +1,11 @@
-from pathlib import Path
+from pandas.api.types import is_bool_dtype, is_string_dtype
 
 from ee_mvp import DEFAULT_CONFIG, analyze
 from ee_mvp.models import load_project_file
 
 
-def test_demo_project_runs(tmp_path):
-    project = load_project_file(Path(__file__).resolve().parents[1] / "examples" / "demo_project.json")
+def test_demo_project_runs(demo_project_path, tmp_path):
+    project = load_project_file(demo_project_path)
     results = analyze(project, DEFAULT_CONFIG, write_csv=True, out_dir=tmp_path)
     assert all(not frame.empty for frame in results.values())
     # CSV outputs plus run_meta.json should exist
@@ -21,27 +21,57 @@ def test_demo_project_runs(tmp_path):
     assert expected_files.issubset(actual)
 
 
-def test_demo_project_runs_from_json_string():
-    project_path = Path(__file__).resolve().parents[1] / "examples" / "demo_project.json"
-    project_json = project_path.read_text()
-    results = analyze(project_json, DEFAULT_CONFIG)
+def test_demo_project_runs_from_json_string(demo_project_path):
+    results = analyze(demo_project_path.read_text(), DEFAULT_CONFIG)
     assert all(not frame.empty for frame in results.values())
 
 
-def test_results_expose_rows_attribute():
-    project_path = Path(__file__).resolve().parents[1] / "examples" / "demo_project.json"
-    project = project_path.read_text()
-    results = analyze(project, DEFAULT_CONFIG)
+def test_results_expose_rows_attribute(demo_project_path):
+    results = analyze(demo_project_path.read_text(), DEFAULT_CONFIG)
     for frame in results.values():
         assert hasattr(frame, "_rows")
         assert frame._rows == frame.to_dict("records")
 
 
-def test_rows_attribute_persists_on_copy():
-    project_path = Path(__file__).resolve().parents[1] / "examples" / "demo_project.json"
-    project = project_path.read_text()
-    results = analyze(project, DEFAULT_CONFIG)
+def test_rows_attribute_persists_on_copy(demo_project_path):
+    results = analyze(demo_project_path.read_text(), DEFAULT_CONFIG)
     for frame in results.values():
+        # Copy once before and once after the original builds its rows.
+        clone_before = frame.copy()
+        assert frame._rows == frame.to_dict("records")
+        clone_after = frame.copy()
+        for clone in (clone_before, clone_after):
+            assert hasattr(clone, "_rows")
+            assert clone._rows == clone.to_dict("records")
+
+
+def test_rows_attribute_not_shared_with_copy(demo_project_path):
+    results = analyze(demo_project_path.read_text(), DEFAULT_CONFIG)
+    for frame in results.values():
+        original_rows = list(frame._rows)
         clone = frame.copy()
-        assert hasattr(clone, "_rows")
-        assert clone._rows == clone.to_dict("records")
+        assert clone._rows is not frame._rows
+        clone._rows.append({})
+        assert frame._rows == original_rows
+
+
+def test_results_use_python_rounding_on_ties(demo_project_data):
+    tie_entry = {"ckt": "1", "desc": "Tie", "kVA": 846.7245}
+    demo_project_data["panel_schedules"] = [{"panel_id": "PANEL-A", "entries": [tie_entry]}]
+    panel = analyze(demo_project_data, DEFAULT_CONFIG)["panel_summary"].set_index("bus")
+    assert panel.loc["PANEL-A", "kVA_noncont"] == round(846.7245, 3) == 846.725
+
+
+def test_empty_results_keep_column_dtypes(demo_project_data):
+    demo_project_data["edges"] = []
+    results = analyze(demo_project_data, DEFAULT_CONFIG)
+    edges = results["edge_checks"]
+    taps = results["tap_checks"]
+    assert edges.empty and taps.empty
+    for column in ("from", "to", "size_awg", "egc_awg"):
+        assert is_string_dtype(edges[column])
+    assert is_bool_dtype(edges["vd_ok"])
+    for column in ("from", "to"):
+        assert is_string_dtype(taps[column])
+    for column in ("passes_10ft", "passes_25ft", "passes"):
+        assert is_bool_dtype(taps[column])
@@ -0,0 +1,52 @@
+import pytest
+
+from ee_mvp import DEFAULT_CONFIG, analyze
+from ee_mvp.models import load_project
+from ee_mvp.scc import available_fault
+
+
+def _faults(data):
+    frame = available_fault(load_project(data))
+    return dict(zip(frame["bus"], frame["available_fault_kA"]))
+
+
+def test_downstream_source_bus_is_overwritten_by_upstream_path(demo_project_data):
+    demo_project_data["nodes"][1]["available_fault_kA"] = 10.0
+    faults = _faults(demo_project_data)
+    assert faults["PANEL-A"] == pytest.approx(19.600274547843043)
+    assert faults["PANEL-B"] == pytest.approx(4.4342304777207415)
+
+
+def test_non_radial_project_keeps_every_bus(demo_project_data):
+    demo_project_data["edges"].append({"from_id": "PANEL-B", "to_id": "PANEL-A"})
+    results = analyze(demo_project_data, DEFAULT_CONFIG)
+    faults = dict(zip(results["short_circuit"]["bus"], results["short_circuit"]["available_fault_kA"]))
+    assert faults == pytest.approx(
+        {
+            "MSB": 25.0,
+            "PANEL-A": 10.233,
+            "PANEL-B": 4.434,
+            "PANEL-TAP": 22.524,
+        }
+    )
+
+
+def test_unreached_edges_are_not_looked_up(demo_project_data):
+    for node in demo_project_data["nodes"]:
+        node["available_fault_kA"] = None
+    demo_project_data["nodes"].append({"id": "LOAD", "type": "load"})
+    demo_project_data["edges"].append(
+        {
+            "from_id": "PANEL-A",
+            "to_id": "LOAD",
+            "cable": {
+                "conductor": "Cu",
+                "size_awg": "2/0",
+                "qty_per_phase": 1,
+                "installation": "TRAY",
+                "length_ft": 40.0,
+            },
+        }
+    )
+    results = analyze(demo_project_data, DEFAULT_CONFIG)
+    assert results["short_circuit"].empty